@@ -1,10 +1,19 @@
 import click
+import codecs
+import errno
 import os
+import queue
+import threading
 import send2trash
 from pathlib import Path
+from collections import Counter, deque
+from contextlib import closing
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 import random
+import heapq
 import logging
-from typing import List, Tuple, Optional
+from typing import Iterable, Iterator, List, Sequence, Tuple, Optional, Union
 
 
 # Configuration du logging
@@ -16,14 +25,106 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def find_files_with_extension(directory: Path, extension: str, sort_order: str = 'asc') -> Tuple[Path, List[str]]:
+# Nombre de fichiers lus en avance lors de l'affichage de leur contenu
+_PREFETCH_WINDOW = 4
+
+def _normalize_extensions(extension: Union[str, Sequence[str]]) -> Tuple[str, ...]:
+    """
+    Normalise une ou plusieurs extensions : point initial ajouté si nécessaire,
+    mise en minuscules et suppression des doublons.
+
+    Args:
+        extension: Extension, liste d'extensions ou extensions séparées par des virgules
+    """
+    if isinstance(extension, str):
+        extension = extension.split(',')
+
+    suffixes = []
+    for ext in extension:
+        ext = ext.strip().lower()
+        if not ext:
+            continue
+        if not ext.startswith('.'):
+            ext = f'.{ext}'
+        if ext not in suffixes:
+            suffixes.append(ext)
+    return tuple(suffixes)
+
+
+def _iter_matches(directory: Path, suffixes: Tuple[str, ...]) -> Iterator[str]:
+    """
+    Parcourt le répertoire et produit au fil de l'eau les noms des fichiers
+    dont l'extension (en minuscules) correspond à l'une des extensions données.
+
+    Args:
+        directory: Chemin du répertoire à parcourir
+        suffixes: Extensions recherchées, avec le point et en minuscules
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            # Le test sur le nom, le plus sélectif, est fait avant celui sur le type
+            if entry.name.lower().endswith(suffixes) and entry.is_file(follow_symlinks=False):
+                yield entry.name
+
+
+def _reservoir_sample(iterable: Iterable[str], k: int) -> List[str]:
+    """
+    Tire k éléments au hasard dans un itérable sans le matérialiser entièrement.
+
+    Args:
+        iterable: Éléments à échantillonner
+        k: Nombre d'éléments à conserver
+    """
+    reservoir = []
+    for i, item in enumerate(iterable):
+        if i < k:
+            reservoir.append(item)
+        else:
+            j = random.randint(0, i)
+            if j < k:
+                reservoir[j] = item
+    random.shuffle(reservoir)
+    return reservoir
+
+
+def _sort_asc(files: Iterable[str], limit: Optional[int]) -> List[str]:
+    """Trie les fichiers par ordre croissant, en ne gardant que les `limit` premiers."""
+    return sorted(files) if limit is None else heapq.nsmallest(limit, files)
+
+
+def _sort_desc(files: Iterable[str], limit: Optional[int]) -> List[str]:
+    """Trie les fichiers par ordre décroissant, en ne gardant que les `limit` premiers."""
+    return sorted(files, reverse=True) if limit is None else heapq.nlargest(limit, files)
+
+
+def _sort_random(files: Iterable[str], limit: Optional[int]) -> List[str]:
+    """Mélange les fichiers, en n'en gardant que `limit` tirés au hasard."""
+    if limit is not None:
+        return _reservoir_sample(files, limit)
+    files = list(files)
+    random.shuffle(files)
+    return files
+
+
+# Fonctions de tri associées à chaque valeur de l'option --sort-order
+_SORTERS = {
+    'asc': _sort_asc,
+    'desc': _sort_desc,
+    'random': _sort_random,
+}
+
+
+def find_files_with_extension(directory: Path, extension: Union[str, Sequence[str]], sort_order: str = 'asc',
+                              limit: Optional[int] = None) -> Tuple[Path, List[str]]:
     """
     Retourne une liste des fichiers avec l'extension donnée dans le répertoire donné.
     
     Args:
         directory: Chemin du répertoire à parcourir
-        extension: Extension des fichiers à rechercher (avec ou sans le point)
+        extension: Extension des fichiers à rechercher (avec ou sans le point). Plusieurs
+            extensions peuvent être données sous forme de liste ou séparées par des virgules
         sort_order: Ordre de tri ('asc', 'desc' ou 'random')
+        limit: Nombre maximal de fichiers à retourner (tous si None)
         
     Returns:
         Tuple contenant le chemin du répertoire et la liste des fichiers trouvés
@@ -31,24 +132,34 @@ def find_files_with_extension(directory: Path, extension: str, sort_order: str =
     Raises:
         click.BadParameter: Si le répertoire n'existe pas ou si aucun fichier n'est trouvé
     """
-    if not directory.exists():
-        raise click.BadParameter(f"Le dossier '{directory}' n'existe pas.")
-    
-    if not directory.is_dir():
-        raise click.BadParameter(f"'{directory}' n'est pas un dossier.")
+    # Normaliser les extensions (ajouter le point si nécessaire)
+    suffixes = _normalize_extensions(extension)
 
     # Vérifier que l'extension est valide
-    if not extension:
+    if not suffixes:
         raise click.BadParameter("L'extension doit être spécifiée.")
-    
-    # Normaliser l'extension (ajouter le point si nécessaire)
-    if not extension.startswith("."):
-        extension = f".{extension}"
 
-    # Récupérer la liste des noms de fichiers avec l'extension donnée
+    if limit is not None and limit < 1:
+        raise click.BadParameter("La limite doit être un entier positif.")
+
+    extension = ", ".join(suffixes)
+
     try:
-        files = [entry.name for entry in os.scandir(directory) 
-                if entry.is_file() and entry.name.lower().endswith(extension.lower())]
+        sorter = _SORTERS[sort_order]
+    except KeyError:
+        raise click.BadParameter(
+            "L'ordre de tri doit être 'asc', 'desc' ou 'random'.")
+
+    # Récupérer et trier les fichiers au fil du parcours du répertoire. L'existence
+    # et le type du dossier sont vérifiés par son ouverture, sans stat préalable.
+    try:
+        # Fermer le dossier dès la fin du tri, même en cas d'erreur en cours de parcours
+        with closing(_iter_matches(directory, suffixes)) as matches:
+            files = sorter(matches, limit)
+    except FileNotFoundError:
+        raise click.BadParameter(f"Le dossier '{directory}' n'existe pas.")
+    except NotADirectoryError:
+        raise click.BadParameter(f"'{directory}' n'est pas un dossier.")
     except PermissionError:
         raise click.BadParameter(f"Impossible d'accéder au dossier '{directory}': permission refusée.")
     except Exception as e:
@@ -57,22 +168,21 @@ def find_files_with_extension(directory: Path, extension: str, sort_order: str =
     if not files:
         raise click.BadParameter(
             f"Aucun fichier avec l'extension '{extension}' trouvé dans le dossier '{directory}'.")
-
-    # Trier la liste selon l'ordre spécifié
-    if sort_order == "asc":
-        files.sort()
-    elif sort_order == "desc":
-        files.sort(reverse=True)
-    elif sort_order == "random":
-        random.shuffle(files)
-    else:
-        raise click.BadParameter(
-            "L'ordre de tri doit être 'asc', 'desc' ou 'random'.")
             
     logger.info(f"Trouvé {len(files)} fichier(s) avec l'extension '{extension}' dans '{directory}'")
     return directory, files
 
 
+def _format_file_list(files: List[str]) -> str:
+    """
+    Construit la liste numérotée des fichiers, pour l'afficher en une seule écriture.
+
+    Args:
+        files: Liste des noms de fichiers
+    """
+    return "\n".join(f"{i}. {file}" for i, file in enumerate(files, 1))
+
+
 def delete_file(directory_path: Path, file: str) -> bool:
     """
     Supprime un fichier en l'envoyant à la corbeille.
@@ -84,23 +194,60 @@ def delete_file(directory_path: Path, file: str) -> bool:
     Returns:
         bool: True si la suppression a réussi, False sinon
     """
-    file_path = directory_path.joinpath(file)
-    
-    if not file_path.exists():
-        click.echo(f"Le fichier '{file}' n'existe pas.")
-        return False
+    file_path = os.path.join(os.fspath(directory_path), file)
 
+    # Pas de vérification préalable : send2trash signale lui-même un fichier absent
     try:
-        send2trash.send2trash(str(file_path))
+        send2trash.send2trash(file_path)
         click.echo(f"Le fichier '{file}' a été envoyé dans la corbeille.")
         logger.info(f"Fichier supprimé: {file_path}")
         return True
     except Exception as e:
+        if isinstance(e, OSError) and e.errno == errno.ENOENT:
+            click.echo(f"Le fichier '{file}' n'existe pas.")
+            return False
         click.echo(f"Erreur lors de la mise à la corbeille du fichier '{file}': {e}")
         logger.error(f"Erreur de suppression pour {file_path}: {e}")
         return False
 
 
+def _split_batch_failure(error: Exception, paths: List[str]) -> Tuple[int, int]:
+    """
+    Détermine l'état des fichiers après l'échec d'une suppression groupée.
+
+    send2trash traite les chemins dans l'ordre et s'arrête au premier échec :
+    les chemins qui précèdent ont déjà été envoyés à la corbeille.
+
+    Args:
+        error: Exception levée par send2trash
+        paths: Chemins passés à send2trash, dans l'ordre
+
+    Returns:
+        Tuple (trashed, resume) : paths[:trashed] sont dans la corbeille,
+        paths[trashed:resume] ont disparu sans qu'on sache s'ils ont été envoyés
+        dans la corbeille ou s'ils n'existaient pas, paths[resume:] restent à traiter
+    """
+    # Chemin en cause, tel que rapporté par l'exception
+    filename = getattr(error, 'filename', None)
+    message = str(error)
+    for i, path in enumerate(paths):
+        if path == filename or message.endswith(path):
+            return i, i
+
+    # À défaut, les chemins disparus en tête de liste ont été traités...
+    vanished = 0
+    while vanished < len(paths) and not os.path.lexists(paths[vanished]):
+        vanished += 1
+
+    # ... sauf si l'échec vient d'un fichier absent : il fait alors partie de ces
+    # chemins disparus, sans qu'on puisse savoir lequel
+    if isinstance(error, OSError) and error.errno == errno.ENOENT:
+        if vanished <= 1:
+            return 0, 0
+        return 0, vanished
+    return vanished, vanished
+
+
 def delete_files(directory_path: Path, files: List[str], confirm: bool = False) -> None:
     """
     Supprime tous les fichiers de la liste.
@@ -112,8 +259,7 @@ def delete_files(directory_path: Path, files: List[str], confirm: bool = False)
     """
     # Afficher une liste des fichiers à supprimer
     click.echo(f"\nFichiers à supprimer ({len(files)}):")
-    for i, file in enumerate(files, 1):
-        click.echo(f"{i}. {file}")
+    click.echo(_format_file_list(files))
     
     # Confirmation globale si beaucoup de fichiers
     if len(files) > 5 and confirm:
@@ -122,19 +268,99 @@ def delete_files(directory_path: Path, files: List[str], confirm: bool = False)
             click.echo("Opération annulée.")
             return
 
-    # Suppression des fichiers
-    deleted_count = 0
+    # Sélection des fichiers à supprimer
+    selected = []
     for file in files:
         if confirm and len(files) <= 5:
             prompt = input(f"\nVoulez-vous supprimer le fichier '{file}' ? [o/N] ")
             if prompt.lower() not in ["o", "oui"]:
                 click.echo(f"Le fichier '{file}' a été ignoré.")
                 continue
-        
-        if delete_file(directory_path, file):
-            deleted_count += 1
-    
+        selected.append(file)
+
+    # Suppression des fichiers en un seul appel à send2trash. En cas d'échec
+    # (fichier absent, droits...), les fichiers restants sont retraités
+    # individuellement pour identifier précisément ceux en cause.
+    deleted_count = 0
+    uncertain_count = 0
+    dir_str = os.fspath(directory_path)
+    paths = [os.path.join(dir_str, file) for file in selected]
+
+    if selected:
+        try:
+            send2trash.send2trash(paths)
+        except TypeError:
+            # Anciennes versions de send2trash (< 1.8) : pas de support des listes
+            trashed = resume = 0
+        except Exception as e:
+            logger.warning(f"Échec de la suppression groupée, suppression fichier par fichier: {e}")
+            trashed, resume = _split_batch_failure(e, paths)
+        else:
+            trashed = resume = len(selected)
+
+        # Les fichiers qui précèdent l'échec sont déjà dans la corbeille
+        for file, file_path in zip(selected[:trashed], paths[:trashed]):
+            click.echo(f"Le fichier '{file}' a été envoyé dans la corbeille.")
+            logger.info(f"Fichier supprimé: {file_path}")
+        for file, file_path in zip(selected[trashed:resume], paths[trashed:resume]):
+            click.echo(f"Le fichier '{file}' a disparu : il a été envoyé dans la corbeille "
+                       f"ou n'existait pas.")
+            logger.warning(f"Suppression non confirmée: {file_path}")
+        uncertain_count = resume - trashed
+        deleted_count = trashed + sum(delete_file(directory_path, file)
+                                      for file in selected[resume:])
+
     click.echo(f"\n{deleted_count} fichier(s) supprimé(s) sur {len(files)}.")
+    if uncertain_count:
+        click.echo(f"{uncertain_count} fichier(s) dont la suppression n'a pas pu être confirmée.")
+
+
+def _read_prefix(file_path: str, limit: int) -> Tuple[str, bool]:
+    """
+    Lit au plus `limit` octets d'un fichier et les décode en UTF-8.
+
+    Seul le préfixe lu est décodé ; un caractère multi-octets coupé par la
+    limite est ignoré plutôt que remplacé. Les fins de ligne Windows ('\\r\\n')
+    et Mac ('\\r') sont converties en '\\n', comme en mode texte.
+
+    Args:
+        file_path: Chemin du fichier à lire
+        limit: Nombre maximal d'octets à lire
+
+    Returns:
+        Tuple contenant le début du contenu et un booléen indiquant s'il a été tronqué
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read(limit + 1)
+    truncated = len(data) > limit
+    if truncated:
+        content = codecs.getincrementaldecoder('utf-8')('replace').decode(data[:limit])
+    else:
+        content = data.decode('utf-8', 'replace')
+    return content.replace('\r\n', '\n').replace('\r', '\n'), truncated
+
+
+def _prefetch_reads(file_paths: List[str], limit: int,
+                    window: int = _PREFETCH_WINDOW) -> Iterator[Future]:
+    """
+    Lit le début des fichiers dans un pool de threads, avec `window` lectures
+    lancées en avance, et produit les résultats dans l'ordre de la liste.
+
+    Args:
+        file_paths: Chemins des fichiers à lire
+        limit: Nombre maximal d'octets à lire par fichier
+        window: Nombre de lectures en cours simultanément
+    """
+    paths = iter(file_paths)
+    with ThreadPoolExecutor(max_workers=window) as executor:
+        pending = deque(executor.submit(_read_prefix, path, limit)
+                        for path in islice(paths, window))
+        while pending:
+            future = pending.popleft()
+            path = next(paths, None)
+            if path is not None:
+                pending.append(executor.submit(_read_prefix, path, limit))
+            yield future
 
 
 def display_files_content(directory_path: Path, files: List[str], confirm: bool = False) -> None:
@@ -156,74 +382,187 @@ def display_files_content(directory_path: Path, files: List[str], confirm: bool
         num_cols = min(4, len(files))
         files_per_col = (len(files) + num_cols - 1) // num_cols
         
-        for i in range(0, len(files), files_per_col):
-            chunk = files[i:i + files_per_col]
-            for j, file in enumerate(chunk):
-                # Tronquer les noms de fichiers trop longs
-                short_file = file[:17] + '...' if len(file) > 20 else file
-                click.echo(f"{i+j+1:3d}. {short_file:<20}", nl=False)
-            click.echo()
+        # Tronquer les noms de fichiers trop longs
+        short_files = [file if len(file) <= 20 else file[:17] + '...' for file in files]
+
+        # Le tableau complet est écrit en une seule fois
+        click.echo("\n".join(
+            ''.join(f"{idx:3d}. {short_file:<20}"
+                    for idx, short_file in enumerate(short_files[i:i + files_per_col], i + 1))
+            for i in range(0, len(files), files_per_col)))
     else:
         # Affichage simple pour un petit nombre de fichiers
-        for i, file in enumerate(files, 1):
-            click.echo(f"{i}. {file}")
+        click.echo(_format_file_list(files))
 
     # Affichage du contenu des fichiers
-    if confirm:
-        for file in files:
-            user_input = input(f"\nVoulez-vous afficher le contenu du fichier '{file}' ? [o/N] ")
-            if user_input.lower() not in ['o', 'oui']:
-                continue
+    limit = 10000 if confirm else 5000
+    dir_str = os.fspath(directory_path)
+    file_paths = [os.path.join(dir_str, file) for file in files]
+
+    # Sans confirmation, tous les fichiers sont affichés : les lectures suivantes
+    # sont lancées en avance pendant l'affichage du fichier courant
+    reads = None if confirm else _prefetch_reads(file_paths, limit)
+
+    try:
+        for file, file_path in zip(files, file_paths):
+            if confirm:
+                user_input = input(f"\nVoulez-vous afficher le contenu du fichier '{file}' ? [o/N] ")
+                if user_input.lower() not in ['o', 'oui']:
+                    continue
 
             # Afficher le contenu du fichier
-            file_path = directory_path.joinpath(file)
-            click.echo(f"\nContenu du fichier '{file}' :")
-            click.echo("─" * 50)
-            
-            try:
-                # Essayer de lire le fichier comme texte
-                with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                    content = f.read()
-                    
-                    # Limiter l'affichage pour les très grands fichiers
-                    if len(content) > 10000:
-                        click.echo(content[:10000])
-                        click.echo("\n[...] Le contenu est trop volumineux, affichage tronqué.")
-                    else:
-                        click.echo(content)
-            except UnicodeDecodeError:
-                click.echo("[Erreur] Ce fichier n'est pas un fichier texte lisible.")
-            except Exception as e:
-                click.echo(f"[Erreur] Lecture du fichier '{file}': {e}")
-            
-            click.echo("─" * 50)
-    else:
-        # Sans confirmation, afficher tous les fichiers directement
-        for file in files:
-            file_path = directory_path.joinpath(file)
             click.echo(f"\nContenu du fichier '{file}' :")
             click.echo("─" * 50)
-            
+
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                    content = f.read()
-                    if len(content) > 5000:
-                        click.echo(content[:5000])
-                        click.echo("\n[...] Le contenu est trop volumineux, affichage tronqué.")
-                    else:
-                        click.echo(content)
+                # Limiter l'affichage pour les très grands fichiers
+                if reads is None:
+                    content, truncated = _read_prefix(file_path, limit)
+                else:
+                    content, truncated = next(reads).result()
+                click.echo(content)
+                if truncated:
+                    click.echo("\n[...] Le contenu est trop volumineux, affichage tronqué.")
             except Exception as e:
                 click.echo(f"[Erreur] Lecture du fichier '{file}': {e}")
-            
+
             click.echo("─" * 50)
+    finally:
+        if reads is not None:
+            reads.close()
 
 
-def count_files_by_extension(directory: Path) -> dict:
+def _ext_lower(name: str) -> str:
+    """Retourne l'extension d'un nom de fichier en minuscules (chaîne vide si aucune)."""
+    # Équivalent à os.path.splitext pour un simple nom : les points initiaux
+    # (fichiers cachés comme '.bashrc') ne délimitent pas d'extension
+    head, _, ext = name.rpartition('.')
+    if head.lstrip('.'):
+        return '.' + ext.lower()
+    return ''
+
+
+def _count_directory(directory: Union[str, Path], with_subdirs: bool = False) -> Tuple[Counter, List[str]]:
+    """
+    Compte les fichiers par extension dans un seul répertoire.
+
+    Args:
+        directory: Chemin du répertoire à analyser
+        with_subdirs: Si True, relève aussi les sous-dossiers (pour l'analyse récursive)
+
+    Returns:
+        Tuple contenant le compteur des extensions et la liste des sous-dossiers
+    """
+    subdirs = []
+
+    with os.scandir(directory) as it:
+        if not with_subdirs:
+            extensions = Counter(_ext_lower(entry.name) for entry in it
+                                 if entry.is_file(follow_symlinks=False))
+        else:
+            extensions = Counter()
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    extensions[_ext_lower(entry.name)] += 1
+                elif entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+    # Les fichiers sans extension ne sont pas comptés
+    del extensions['']
+
+    return extensions, subdirs
+
+
+def _walk_counts(stack: List[str], extensions: Counter,
+                 shared: Optional['queue.Queue[Optional[str]]'] = None, jobs: int = 1) -> None:
+    """
+    Parcourt en profondeur les dossiers de `stack` et ajoute leurs fichiers à `extensions`.
+
+    Args:
+        stack: Dossiers restant à parcourir (modifiée sur place)
+        extensions: Compteur des extensions à compléter
+        shared: File partagée entre threads ; tant qu'elle contient moins de `jobs`
+            dossiers, les sous-dossiers trouvés y sont déposés pour les threads inactifs
+        jobs: Nombre de threads de parcours
+    """
+    while stack:
+        path = stack.pop()
+        try:
+            counts, subdirs = _count_directory(path, with_subdirs=True)
+        except OSError as e:
+            logger.warning(f"Dossier ignoré: {e}")
+            continue
+
+        extensions.update(counts)
+        for subdir in subdirs:
+            if shared is not None and shared.qsize() < jobs:
+                shared.put(subdir)
+            else:
+                stack.append(subdir)
+
+
+def _count_worker(shared: 'queue.Queue[Optional[str]]', jobs: int, results: List[Counter]) -> None:
+    """Boucle d'un thread de parcours : traite les dossiers de la file jusqu'à recevoir None."""
+    extensions = Counter()
+    while True:
+        path = shared.get()
+        if path is None:
+            break
+        try:
+            _walk_counts([path], extensions, shared, jobs)
+        finally:
+            shared.task_done()
+    results.append(extensions)
+
+
+def _count_recursive(directory: Path, jobs: int = 1) -> Counter:
+    """
+    Compte les fichiers par extension dans toute l'arborescence d'un répertoire.
+
+    Par défaut, l'arborescence est parcourue séquentiellement, ce qui est le plus
+    rapide sur un disque local. Avec plusieurs threads, chacun parcourt sa propre
+    pile de dossiers et ne partage des sous-dossiers que lorsque la file commune se
+    vide : cela recouvre les latences des systèmes de fichiers réseau, la lecture
+    d'un dossier libérant le GIL.
+
+    Args:
+        directory: Chemin du répertoire racine
+        jobs: Nombre de threads de parcours
+    """
+    # Une erreur sur le dossier racine est remontée à l'appelant
+    extensions, subdirs = _count_directory(directory, with_subdirs=True)
+
+    if jobs <= 1:
+        _walk_counts(subdirs, extensions)
+        return extensions
+
+    shared = queue.Queue()
+    for subdir in subdirs:
+        shared.put(subdir)
+
+    results = []
+    workers = [threading.Thread(target=_count_worker, args=(shared, jobs, results), daemon=True)
+               for _ in range(jobs)]
+    for worker in workers:
+        worker.start()
+    shared.join()
+    for _ in workers:
+        shared.put(None)
+    for worker in workers:
+        worker.join()
+
+    for counts in results:
+        extensions.update(counts)
+    return extensions
+
+
+def count_files_by_extension(directory: Path, recursive: bool = False, jobs: int = 1) -> dict:
     """
     Compte le nombre de fichiers par extension dans un répertoire.
     
     Args:
         directory: Chemin du répertoire à analyser
+        recursive: Si True, analyse également tous les sous-dossiers
+        jobs: Nombre de threads pour l'analyse récursive (utile sur un système de fichiers réseau)
         
     Returns:
         dict: Dictionnaire avec les extensions comme clés et le nombre de fichiers comme valeurs
@@ -231,12 +570,10 @@ def count_files_by_extension(directory: Path) -> dict:
     extensions = {}
     
     try:
-        for entry in os.scandir(directory):
-            if entry.is_file():
-                _, ext = os.path.splitext(entry.name)
-                ext = ext.lower()
-                if ext:
-                    extensions[ext] = extensions.get(ext, 0) + 1
+        if recursive:
+            extensions = _count_recursive(directory, jobs)
+        else:
+            extensions, _ = _count_directory(directory)
     except Exception as e:
         click.echo(f"Erreur lors de l'analyse du répertoire: {e}")
     
@@ -257,23 +594,26 @@ def cli(ctx):
 @click.option('-d', '--delete', is_flag=True, help='Supprime les fichiers.')
 @click.option('-c', '--confirm', is_flag=True, help='Demande confirmation.')
 @click.option('-p', '--display', is_flag=True, help='Affiche le contenu.')
-@click.option('-s', '--sort-order', type=click.Choice(['asc', 'desc', 'random']), 
+@click.option('-s', '--sort-order', type=click.Choice(list(_SORTERS)), 
               default='asc', help='Ordre de tri des fichiers.')
+@click.option('-n', '--limit', type=click.IntRange(min=1), default=None,
+              help='Nombre maximal de fichiers à traiter.')
 def search_command(directory: str, extension: str, delete: bool, confirm: bool, 
-                 display: bool, sort_order: str) -> None:
+                 display: bool, sort_order: str, limit: Optional[int]) -> None:
     """
     Recherche et gère les fichiers par extension.
     
     Arguments:
     \b
     DIRECTORY  Le répertoire dans lequel rechercher
-    EXTENSION  L'extension des fichiers à rechercher (sans le point)
+    EXTENSION  L'extension des fichiers à rechercher (sans le point),
+               plusieurs extensions pouvant être séparées par des virgules
     """
     directory_path = Path(directory)
     
     try:
         # Recherche des fichiers
-        _, files = find_files_with_extension(directory_path, extension, sort_order)
+        _, files = find_files_with_extension(directory_path, extension, sort_order, limit)
         
         # Exécution des actions demandées
         if delete:
@@ -282,9 +622,8 @@ def search_command(directory: str, extension: str, delete: bool, confirm: bool,
             display_files_content(directory_path, files, confirm)
         else:
             # Par défaut, afficher simplement la liste des fichiers
-            click.echo(f"\nFichiers avec l'extension '.{extension}' dans '{directory}':")
-            for i, file in enumerate(files, 1):
-                click.echo(f"{i}. {file}")
+            click.echo(f"\nFichiers avec l'extension '{', '.join(_normalize_extensions(extension))}' dans '{directory}':")
+            click.echo(_format_file_list(files))
             
             click.echo(f"\nTotal: {len(files)} fichier(s)")
             click.echo("\nUtilisez les options --delete ou --display pour agir sur ces fichiers.")
@@ -298,7 +637,10 @@ def search_command(directory: str, extension: str, delete: bool, confirm: bool,
 
 @cli.command('analyze')
 @click.argument('directory', type=click.Path(exists=True))
-def analyze_command(directory: str) -> None:
+@click.option('-r', '--recursive', is_flag=True, help='Analyse aussi les sous-dossiers.')
+@click.option('-j', '--jobs', type=click.IntRange(min=1), default=1,
+              help="Nombre de threads pour l'analyse récursive (systèmes de fichiers réseau).")
+def analyze_command(directory: str, recursive: bool, jobs: int) -> None:
     """
     Analyse un répertoire et compte les fichiers par extension.
     
@@ -309,7 +651,7 @@ def analyze_command(directory: str) -> None:
     directory_path = Path(directory)
     
     click.echo(f"Analyse du répertoire: {directory_path}")
-    extensions = count_files_by_extension(directory_path)
+    extensions = count_files_by_extension(directory_path, recursive, jobs)
     
     if not extensions:
         click.echo("Aucun fichier trouvé dans ce répertoire.")
@@ -320,8 +662,7 @@ def analyze_command(directory: str) -> None:
     
     click.echo("\nFichiers par extension:")
     click.echo("─" * 30)
-    for ext, count in sorted_extensions:
-        click.echo(f"{ext:<10} : {count:>5} fichier(s)")
+    click.echo("\n".join(f"{ext:<10} : {count:>5} fichier(s)" for ext, count in sorted_extensions))
     
     total = sum(extensions.values())
     click.echo("─" * 30)
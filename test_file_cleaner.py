@@ -1,14 +1,17 @@
+import errno
+import gc
 import os
 import tempfile
 import unittest
 from pathlib import Path
 import shutil
+import warnings
 from click.testing import CliRunner
 from unittest.mock import patch, MagicMock
 
 # Import le module à tester
-from file_cleaner import find_files_with_extension, delete_file, count_files_by_extension
-from file_cleaner import cli, search_command, analyze_command
+from file_cleaner import find_files_with_extension, delete_file, delete_files, count_files_by_extension
+from file_cleaner import cli, search_command, analyze_command, _iter_matches
 
 
 class TestFileCleaner(unittest.TestCase):
@@ -57,13 +60,54 @@ class TestFileCleaner(unittest.TestCase):
         directory, files = find_files_with_extension(Path(self.temp_dir), 'txt', 'desc')
         self.assertEqual(files, ['test2.txt', 'test1.txt'])
 
+    def test_find_files_multiple_extensions(self):
+        """Teste la recherche de plusieurs extensions à la fois."""
+        directory, files = find_files_with_extension(Path(self.temp_dir), 'txt,PDF', 'asc')
+        self.assertEqual(files, ['document.pdf', 'test1.txt', 'test2.txt'])
+
+        directory, files = find_files_with_extension(Path(self.temp_dir), ['.py', 'jpg'], 'asc')
+        self.assertEqual(files, ['image.jpg', 'script.py'])
+
+    def test_find_files_non_ascii_extension(self):
+        """Teste la recherche d'une extension non ASCII, insensible à la casse."""
+        open(os.path.join(self.temp_dir, 'résumé.ÉTÉ'), 'w').close()
+
+        directory, files = find_files_with_extension(Path(self.temp_dir), 'été', 'asc')
+        self.assertEqual(files, ['résumé.ÉTÉ'])
+
+    def test_find_files_with_limit(self):
+        """Teste la limitation du nombre de fichiers retournés."""
+        directory, files = find_files_with_extension(Path(self.temp_dir), 'txt', 'asc', limit=1)
+        self.assertEqual(files, ['test1.txt'])
+
+        directory, files = find_files_with_extension(Path(self.temp_dir), 'txt', 'desc', limit=1)
+        self.assertEqual(files, ['test2.txt'])
+
+        directory, files = find_files_with_extension(Path(self.temp_dir), 'txt', 'random', limit=1)
+        self.assertEqual(len(files), 1)
+        self.assertIn(files[0], ['test1.txt', 'test2.txt'])
+
+    def test_find_files_invalid_sort_order(self):
+        """Teste le rejet d'un ordre de tri inconnu."""
+        from click import BadParameter
+
+        with self.assertRaisesRegex(BadParameter, "ordre de tri"):
+            find_files_with_extension(Path(self.temp_dir), 'txt', 'size')
+
     def test_find_files_nonexistent_directory(self):
         """Teste la recherche dans un répertoire inexistant."""
         from click import BadParameter
         
-        with self.assertRaises(BadParameter):
+        with self.assertRaisesRegex(BadParameter, "n'existe pas"):
             find_files_with_extension(Path('/nonexistent/dir'), 'txt', 'asc')
 
+    def test_find_files_not_a_directory(self):
+        """Teste la recherche dans un chemin qui n'est pas un dossier."""
+        from click import BadParameter
+
+        with self.assertRaisesRegex(BadParameter, "n'est pas un dossier"):
+            find_files_with_extension(Path(self.temp_dir) / 'test1.txt', 'txt', 'asc')
+
     def test_find_files_no_matches(self):
         """Teste le cas où aucun fichier ne correspond à l'extension."""
         from click import BadParameter
@@ -80,9 +124,99 @@ class TestFileCleaner(unittest.TestCase):
         mock_send2trash.assert_called_once_with(str(Path(self.temp_dir) / 'test1.txt'))
         
         # Test de suppression d'un fichier inexistant
+        mock_send2trash.side_effect = OSError(errno.ENOENT, "File not found")
         result = delete_file(Path(self.temp_dir), 'nonexistent.txt')
         self.assertFalse(result)
 
+    @patch('file_cleaner.send2trash.send2trash')
+    def test_delete_files_batch(self, mock_send2trash):
+        """Teste que delete_files envoie tous les fichiers en un seul appel."""
+        delete_files(Path(self.temp_dir), ['test1.txt', 'test2.txt'])
+        mock_send2trash.assert_called_once_with([
+            str(Path(self.temp_dir) / 'test1.txt'),
+            str(Path(self.temp_dir) / 'test2.txt'),
+        ])
+
+    @patch('file_cleaner.click.echo')
+    @patch('file_cleaner.send2trash.send2trash')
+    def test_delete_files_missing_file(self, mock_send2trash, mock_echo):
+        """Teste qu'un fichier absent n'empêche pas la suppression des autres."""
+        def fake_send2trash(paths):
+            # Comme send2trash : traitement dans l'ordre, arrêt au premier échec
+            for path in paths if isinstance(paths, list) else [paths]:
+                if not os.path.exists(path):
+                    raise OSError(errno.ENOENT, f"File not found: {path}")
+                os.remove(path)
+        mock_send2trash.side_effect = fake_send2trash
+
+        delete_files(Path(self.temp_dir), ['test1.txt', 'nonexistent.txt'])
+        messages = [args[0] for args, _ in mock_echo.call_args_list if args]
+        self.assertIn("Le fichier 'test1.txt' a été envoyé dans la corbeille.", messages)
+        self.assertIn("Le fichier 'nonexistent.txt' n'existe pas.", messages)
+        self.assertIn("\n1 fichier(s) supprimé(s) sur 2.", messages)
+
+        # Les fichiers qui suivent l'échec sont retraités individuellement
+        mock_echo.reset_mock()
+        delete_files(Path(self.temp_dir), ['document.pdf', 'nonexistent.txt', 'image.jpg'])
+        messages = [args[0] for args, _ in mock_echo.call_args_list if args]
+        self.assertIn("Le fichier 'document.pdf' a été envoyé dans la corbeille.", messages)
+        self.assertIn("Le fichier 'nonexistent.txt' n'existe pas.", messages)
+        self.assertIn("Le fichier 'image.jpg' a été envoyé dans la corbeille.", messages)
+        self.assertIn("\n2 fichier(s) supprimé(s) sur 3.", messages)
+
+    @patch('file_cleaner.click.echo')
+    @patch('file_cleaner.send2trash.send2trash')
+    def test_delete_files_failure_without_path(self, mock_send2trash, mock_echo):
+        """Teste l'échec d'une suppression groupée dont l'erreur ne nomme pas le fichier."""
+        def fake_send2trash(paths):
+            for path in paths if isinstance(paths, list) else [paths]:
+                if not os.path.exists(path):
+                    raise OSError(errno.ENOENT, "File not found")
+                os.remove(path)
+        mock_send2trash.side_effect = fake_send2trash
+
+        # Deux fichiers absents à la suite : aucun fichier disparu n'est annoncé
+        # comme envoyé dans la corbeille sans certitude
+        delete_files(Path(self.temp_dir), ['test1.txt', 'm1.txt', 'm2.txt', 'test2.txt'])
+        messages = [args[0] for args, _ in mock_echo.call_args_list if args]
+        for file in ('test1.txt', 'm1.txt', 'm2.txt'):
+            self.assertNotIn(f"Le fichier '{file}' a été envoyé dans la corbeille.", messages)
+            self.assertIn(f"Le fichier '{file}' a disparu : il a été envoyé dans la corbeille "
+                          f"ou n'existait pas.", messages)
+        self.assertIn("Le fichier 'test2.txt' a été envoyé dans la corbeille.", messages)
+        self.assertIn("\n1 fichier(s) supprimé(s) sur 4.", messages)
+        self.assertIn("3 fichier(s) dont la suppression n'a pas pu être confirmée.", messages)
+
+    @patch('file_cleaner.click.echo')
+    @patch('file_cleaner.send2trash.send2trash')
+    def test_delete_files_other_failure_without_path(self, mock_send2trash, mock_echo):
+        """Teste un échec autre qu'un fichier absent, sans chemin dans l'erreur."""
+        def fake_send2trash(paths):
+            for path in paths if isinstance(paths, list) else [paths]:
+                if path.endswith('document.pdf'):
+                    raise OSError(errno.EACCES, "Permission denied")
+                os.remove(path)
+        mock_send2trash.side_effect = fake_send2trash
+
+        delete_files(Path(self.temp_dir), ['test1.txt', 'document.pdf', 'image.jpg'])
+        messages = [args[0] for args, _ in mock_echo.call_args_list if args]
+        self.assertIn("Le fichier 'test1.txt' a été envoyé dans la corbeille.", messages)
+        self.assertIn("Le fichier 'image.jpg' a été envoyé dans la corbeille.", messages)
+        self.assertIn("\n2 fichier(s) supprimé(s) sur 3.", messages)
+
+    @patch('file_cleaner.send2trash.send2trash')
+    def test_delete_files_fallback(self, mock_send2trash):
+        """Teste le repli fichier par fichier si send2trash refuse une liste."""
+        def fake_send2trash(paths):
+            if isinstance(paths, list):
+                raise TypeError("liste non supportée")
+        mock_send2trash.side_effect = fake_send2trash
+
+        delete_files(Path(self.temp_dir), ['test1.txt', 'test2.txt'])
+        mock_send2trash.assert_any_call(str(Path(self.temp_dir) / 'test1.txt'))
+        mock_send2trash.assert_any_call(str(Path(self.temp_dir) / 'test2.txt'))
+        self.assertEqual(mock_send2trash.call_count, 3)
+
     def test_count_files_by_extension(self):
         """Teste la fonction count_files_by_extension."""
         extensions = count_files_by_extension(Path(self.temp_dir))
@@ -92,6 +226,50 @@ class TestFileCleaner(unittest.TestCase):
         self.assertEqual(extensions['.jpg'], 1)
         self.assertEqual(extensions['.py'], 1)
 
+    def test_count_files_ignores_hidden_and_extensionless(self):
+        """Teste que les fichiers cachés ou sans extension ne sont pas comptés."""
+        for filename in ('.bashrc', 'Makefile', 'archive.TAR.GZ'):
+            open(os.path.join(self.temp_dir, filename), 'w').close()
+
+        extensions = count_files_by_extension(Path(self.temp_dir))
+        self.assertEqual(extensions['.gz'], 1)
+        self.assertNotIn('.bashrc', extensions)
+        self.assertEqual(sum(extensions.values()), 6)
+
+    def test_count_files_by_extension_recursive(self):
+        """Teste l'analyse récursive des sous-dossiers."""
+        sub_dir = os.path.join(self.temp_dir, 'sous-dossier', 'niveau2')
+        os.makedirs(sub_dir)
+        with open(os.path.join(sub_dir, 'notes.TXT'), 'w') as f:
+            f.write('notes')
+
+        extensions = count_files_by_extension(Path(self.temp_dir))
+        self.assertEqual(extensions['.txt'], 2)
+
+        extensions = count_files_by_extension(Path(self.temp_dir), recursive=True)
+        self.assertEqual(extensions['.txt'], 3)
+        self.assertEqual(extensions['.py'], 1)
+
+        # Le parcours multi-thread donne le même résultat
+        for i in range(20):
+            os.makedirs(os.path.join(self.temp_dir, f'dossier{i}', 'sous'))
+            open(os.path.join(self.temp_dir, f'dossier{i}', 'sous', 'a.txt'), 'w').close()
+        serial = count_files_by_extension(Path(self.temp_dir), recursive=True)
+        parallel = count_files_by_extension(Path(self.temp_dir), recursive=True, jobs=4)
+        self.assertEqual(serial['.txt'], 23)
+        self.assertEqual(parallel, serial)
+
+    def test_scan_closes_directory(self):
+        """Teste que les parcours ferment le dossier sans ResourceWarning."""
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always', ResourceWarning)
+            find_files_with_extension(Path(self.temp_dir), 'txt', 'asc')
+            count_files_by_extension(Path(self.temp_dir))
+            next(_iter_matches(Path(self.temp_dir), ('.txt',)))
+            gc.collect()
+
+        self.assertEqual([w for w in caught if issubclass(w.category, ResourceWarning)], [])
+
     def test_cli_search_command(self):
         """Teste la commande search via l'interface CLI."""
         runner = CliRunner()
@@ -108,6 +286,45 @@ class TestFileCleaner(unittest.TestCase):
             self.assertEqual(result.exit_code, 0)
             self.assertIn('Fichiers à supprimer', result.output)
 
+    def test_cli_search_display(self):
+        """Teste l'affichage du contenu, avec troncature des gros fichiers."""
+        with open(os.path.join(self.temp_dir, 'gros.log'), 'w') as f:
+            f.write('a' * 6000)
+        runner = CliRunner()
+
+        result = runner.invoke(search_command, [self.temp_dir, 'txt', '--display'])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn('Contenu du fichier test1.txt', result.output)
+
+        result = runner.invoke(search_command, [self.temp_dir, 'log', '--display'])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn('a' * 5000, result.output)
+        self.assertNotIn('a' * 5001, result.output)
+        self.assertIn('affichage tronqué', result.output)
+
+    def test_cli_search_display_crlf(self):
+        """Teste que les fins de ligne Windows et Mac sont affichées comme des '\\n'."""
+        with open(os.path.join(self.temp_dir, 'windows.ini'), 'wb') as f:
+            f.write(b'ligne 1\r\nligne 2\rligne 3\n')
+        runner = CliRunner()
+
+        result = runner.invoke(search_command, [self.temp_dir, 'ini', '--display'])
+        self.assertEqual(result.exit_code, 0)
+        self.assertNotIn('\r', result.output)
+        self.assertIn('ligne 1\nligne 2\nligne 3\n', result.output)
+
+    def test_cli_search_display_order(self):
+        """Teste que la lecture anticipée conserve l'ordre d'affichage."""
+        for i in range(9):
+            with open(os.path.join(self.temp_dir, f'note{i}.md'), 'w') as f:
+                f.write(f'contenu {i}')
+        runner = CliRunner()
+
+        result = runner.invoke(search_command, [self.temp_dir, 'md', '--display'])
+        self.assertEqual(result.exit_code, 0)
+        positions = [result.output.index(f'contenu {i}') for i in range(9)]
+        self.assertEqual(positions, sorted(positions))
+
     def test_cli_analyze_command(self):
         """Teste la commande analyze via l'interface CLI."""
         runner = CliRunner()